@@ -1,21 +1,112 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from textblob import TextBlob
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from anyio import to_thread as anyio_to_thread
 from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
+import ahocorasick
+import asyncio
+import bisect
 import re
+import threading
 import uvicorn
 import os
-import requests
+import hashlib
+import httpx
+import numpy as np
+import logging
+import logging.handlers
+import queue
+from cachetools import TTLCache
 from math import copysign
-import json
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="Vibe Check API", version="1.0.0")
+# Environment-derived config, resolved once at import (after load_dotenv)
+# instead of per request
+HF_TOKEN = os.environ.get("HF_API_TOKEN")
+HF_MODEL = os.environ.get("HF_MODEL", "distilbert-base-uncased-finetuned-sst-2-english")
+HF_URL = f"https://api-inference.huggingface.co/models/{HF_MODEL}"
+HF_HEADERS = {"Authorization": f"Bearer {HF_TOKEN}"}
+GEMINI_KEY = os.environ.get("GEMINI_API_KEY") or os.environ.get("geminiapi")
+# Use v1beta API with gemini-2.0-flash model
+GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
+GEMINI_HEADERS = {
+    "Content-Type": "application/json",
+    "X-goog-api-key": GEMINI_KEY,
+}
+
+# Non-blocking diagnostics: records go through a queue and are written by
+# a QueueListener thread, so the request path never waits on stdout. The
+# chatty per-request messages sit at DEBUG and cost nothing when disabled
+# thanks to lazy %-formatting.
+logger = logging.getLogger("vibe-check")
+logger.setLevel(logging.INFO)
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, logging.StreamHandler())
+
+# Shared async HTTP client: reused across requests so outbound AI calls
+# keep their TCP/TLS connections alive instead of re-handshaking each time
+_HTTP = httpx.AsyncClient(
+    http2=True,
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+)
+
+# Bounded TTL caches for the slow AI calls: both are pure functions of the
+# text (+ prompt version), so repeat inputs can skip the network hop
+GEM_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+HF_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+
+
+# Shared pool for the CPU-bound local analyzers; VADER/TextBlob spend most
+# of their time in C regex routines that release the GIL, so the
+# independent sub-analyses genuinely overlap on multi-core hosts
+_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+def _text_key(text: str) -> bytes:
+    """Compact cache key for a text payload."""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm every lazy-loading analyzer at boot.
+
+    TextBlob pulls in NLTK corpora and pattern data on first use, which
+    otherwise lands as multi-second latency on the first /analyze request.
+    Running each pipeline once here front-loads that cost to startup.
+    """
+    _LOG_LISTENER.start()
+    # Size Starlette's sync-endpoint thread pool to the host instead of
+    # the anyio default of 40 tokens, so CPU-bound sync handlers fan out
+    # across cores without oversubscribing them
+    anyio_to_thread.current_default_thread_limiter().total_tokens = (os.cpu_count() or 4) * 2
+    _vader_scores("hello world")
+    _textblob_polsub("hello world")
+    _emotions("hello world")
+    generate_rewrites("hello")
+    yield
+    await _HTTP.aclose()
+    _POOL.shutdown(wait=False)
+    _LOG_LISTENER.stop()
+
+
+app = FastAPI(
+    title="Vibe Check API",
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson serializes the float-heavy payloads in C, several times
+    # faster than the stdlib json encoder FastAPI defaults to
+    default_response_class=ORJSONResponse,
+)
 
 # CORS setup for frontend
 app.add_middleware(
@@ -26,13 +117,138 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize VADER sentiment analyzer
-vader = SentimentIntensityAnalyzer()
+# The NLP analyzers (and their imports, which drag in NLTK machinery) are
+# created lazily: merely importing this module — tests, tooling, uvicorn's
+# --reload watcher — stays cheap, while the lifespan warmup triggers the
+# load before the first request is served.
+_vader = None
+_pattern_analyzer = None
+_analyzer_lock = threading.Lock()
+
+
+def _get_vader():
+    """Return the shared VADER analyzer, creating it on first use."""
+    global _vader
+    if _vader is None:
+        with _analyzer_lock:
+            if _vader is None:
+                from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+                _vader = SentimentIntensityAnalyzer()
+    return _vader
+
+
+def _get_pattern_analyzer():
+    """Return TextBlob's pattern analyzer, creating it on first use.
+
+    Used directly because building a TextBlob per call also runs NLTK
+    tokenization and allocates sentence/word lists we never read.
+    """
+    global _pattern_analyzer
+    if _pattern_analyzer is None:
+        with _analyzer_lock:
+            if _pattern_analyzer is None:
+                from textblob.en.sentiments import PatternAnalyzer
+                _pattern_analyzer = PatternAnalyzer()
+    return _pattern_analyzer
+
+# Precompiled patterns (compiling per request is wasted work on the hot path)
+_NEGATION_RE = re.compile(r'\b(not|no|never|none|nobody|nothing|neither|nowhere|hardly|scarcely|barely)\b')
+_WS_RE = re.compile(r"\s+")
+_SENT_END_RE = re.compile(r'[.!?]+')
+_CAPS_RE = re.compile(r'\b[A-Z]{2,}\b')
+_EXCLAIM_RE = re.compile(r"!+")
+_SOFTEN_RE = re.compile(r"\b(hate|terrible|awful|worst)\b", re.IGNORECASE)
+_SLANG_RE = re.compile(r"\b(imo|idk|u)\b", re.IGNORECASE)
+_PUNCT_CLEAN_RE = re.compile(r"[^\w\s.,'\"-]+")
+_FENCE_RE = re.compile(r'^```(?:json)?\s*\n?(.*?)\n?```\s*$', re.DOTALL)
+
+# Contraction expansion: one alternation + dispatch dict instead of 9 re.sub passes
+CONTRACTIONS = {
+    "can't": "cannot",
+    "won't": "will not",
+    "n't": " not",
+    "'re": " are",
+    "'s": " is",
+    "'d": " would",
+    "'ll": " will",
+    "'ve": " have",
+    "'m": " am",
+}
+# Longest keys first so "can't"/"won't" win over the bare "n't" suffix
+_CONTRACTION_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(CONTRACTIONS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+# Keyword lexicons for emotion detection and text insights
+HAPPY_WORDS = ['happy', 'joy', 'great', 'excellent', 'wonderful', 'amazing',
+               'love', 'good', 'best', 'awesome', 'fantastic', 'thrilled', 'excited',
+               'delighted', 'pleased', 'glad', 'perfect', 'brilliant', '😊', '😀', '🎉', '❤️']
+ANGRY_WORDS = ['angry', 'hate', 'terrible', 'awful', 'worst', 'disgusting',
+               'furious', 'mad', 'rage', 'annoyed', 'frustrated', 'irritated', '😠', '😡', '🤬']
+SAD_WORDS = ['sad', 'depressed', 'unhappy', 'miserable', 'disappointed',
+             'sorry', 'unfortunate', 'bad', 'upset', 'down', 'heartbroken', '😢', '😭', '💔']
+FEAR_WORDS = ['fear', 'scared', 'afraid', 'worried', 'anxious', 'nervous',
+              'terrified', 'panic', 'concern', 'frightened', '😨', '😰']
+SURPRISE_WORDS = ['surprise', 'shocked', 'amazed', 'unexpected', 'wow',
+                  'omg', 'unbelievable', 'incredible', 'astonishing', '😮', '😲']
+SARCASM_MARKERS = ['yeah right', 'sure', 'totally', 'obviously', 'of course']
+STRONG_WORDS = ['hate', 'love', 'amazing', 'terrible', 'awful', 'worst', 'best']
+
+_KEYWORD_BUCKETS = {
+    "happy": HAPPY_WORDS,
+    "angry": ANGRY_WORDS,
+    "sad": SAD_WORDS,
+    "fear": FEAR_WORDS,
+    "surprise": SURPRISE_WORDS,
+    "sarcasm": SARCASM_MARKERS,
+    "strong": STRONG_WORDS,
+}
+
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Build one Aho-Corasick automaton over every keyword bucket.
+
+    A single automaton turns ~70 independent substring scans per request
+    into one linear pass over the text. Keywords shared between buckets
+    (e.g. 'hate' is both angry and strong) carry all their buckets.
+    """
+    word_buckets: Dict[str, List[str]] = {}
+    for bucket, words in _KEYWORD_BUCKETS.items():
+        for word in words:
+            word_buckets.setdefault(word, []).append(bucket)
+    automaton = ahocorasick.Automaton()
+    for word, buckets in word_buckets.items():
+        automaton.add_word(word, tuple(buckets))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AC = _build_keyword_automaton()
+
+
+@lru_cache(maxsize=2048)
+def _keyword_counts(text_lower: str) -> Dict[str, int]:
+    """Count keyword hits per bucket in a single pass over the text.
+
+    Cached so emotion detection and pattern insights share one automaton
+    pass per request. Callers must treat the returned dict as read-only.
+    """
+    counts = dict.fromkeys(_KEYWORD_BUCKETS, 0)
+    for _, buckets in _KEYWORD_AC.iter(text_lower):
+        for bucket in buckets:
+            counts[bucket] += 1
+    return counts
 
 class TextInput(BaseModel):
     text: str
 
 class VibeResponse(BaseModel):
+    # Instances are output-only and built via model_construct: freezing
+    # them and forbidding extras keeps them lean and catches payload
+    # drift between _assemble_vibe and this schema early
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     sentiment: str  # positive, neutral, negative
     confidence: float  # 0-1
     scores: Dict[str, float]  # positive, neutral, negative breakdown
@@ -50,115 +266,190 @@ class VibeResponse(BaseModel):
     # NEW: Gemini AI analysis
     gemini_analysis: Optional[Dict[str, Any]] = None  # AI-powered sentiment analysis
 
+# Sentiment classification as a threshold table: bisect finds the band in
+# one C-level binary search and the result dicts are built once, not per call
+_SENTIMENT_THRESHOLDS = (-0.5, -0.2, 0.2, 0.5)
+_SENTIMENT_TABLE = (
+    {
+        "sentiment": "negative",
+        "emoji": "😤",
+        "vibe": "Very Negative",
+        "color": "#ef4444"  # red
+    },
+    {
+        "sentiment": "negative",
+        "emoji": "😕",
+        "vibe": "Slightly Negative",
+        "color": "#f59e0b"  # orange
+    },
+    {
+        "sentiment": "neutral",
+        "emoji": "😐",
+        "vibe": "Neutral Vibes",
+        "color": "#6b7280"  # gray
+    },
+    {
+        "sentiment": "positive",
+        "emoji": "😊",
+        "vibe": "Pretty Positive",
+        "color": "#22c55e"  # light green
+    },
+    {
+        "sentiment": "very positive",
+        "emoji": "🌟",
+        "vibe": "Super Positive Vibes!",
+        "color": "#10b981"  # green
+    },
+)
+
+
 def get_sentiment_data(compound_score: float) -> Dict[str, str]:
     """Return sentiment classification, emoji, vibe label, and color"""
-    if compound_score >= 0.5:
-        return {
-            "sentiment": "very positive",
-            "emoji": "🌟",
-            "vibe": "Super Positive Vibes!",
-            "color": "#10b981"  # green
-        }
-    elif compound_score >= 0.2:
-        return {
-            "sentiment": "positive",
-            "emoji": "😊",
-            "vibe": "Pretty Positive",
-            "color": "#22c55e"  # light green
-        }
-    elif compound_score >= -0.2:
-        return {
-            "sentiment": "neutral",
-            "emoji": "😐",
-            "vibe": "Neutral Vibes",
-            "color": "#6b7280"  # gray
-        }
-    elif compound_score >= -0.5:
-        return {
-            "sentiment": "negative",
-            "emoji": "😕",
-            "vibe": "Slightly Negative",
-            "color": "#f59e0b"  # orange
-        }
-    else:
-        return {
-            "sentiment": "negative",
-            "emoji": "😤",
-            "vibe": "Very Negative",
-            "color": "#ef4444"  # red
-        }
+    # bisect_right keeps the original >= boundary semantics (0.5 is "very positive")
+    return _SENTIMENT_TABLE[bisect.bisect_right(_SENTIMENT_THRESHOLDS, compound_score)]
+
+def _codepoints(text: str) -> np.ndarray:
+    """View the text as a uint32 codepoint array for vectorized scans."""
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+
+def _punct_counts(codepoints: np.ndarray) -> Dict[str, int]:
+    """Count sentence punctuation with vectorized compares on the codepoint
+    array, replacing three full str.count walks over the text."""
+    return {
+        '.': int((codepoints == 0x2E).sum()),
+        '!': int((codepoints == 0x21).sum()),
+        '?': int((codepoints == 0x3F).sum()),
+    }
+
+
+def _count_emojis(codepoints: np.ndarray) -> int:
+    """Count emoji codepoints with vectorized range checks.
+
+    Covers the same three blocks the old emoji regex did (emoticons,
+    symbols & pictographs, transport), but as a tight C loop over uint32
+    lanes instead of walking a multi-range character class per codepoint.
+    """
+    return int((((codepoints >= 0x1F600) & (codepoints <= 0x1F64F))
+                | ((codepoints >= 0x1F300) & (codepoints <= 0x1F5FF))
+                | ((codepoints >= 0x1F680) & (codepoints <= 0x1F6FF))).sum())
+
+
+def _count_caps_words(text: str) -> int:
+    """Count ALL-CAPS words (two or more uppercase letters, word-bounded).
 
-def analyze_text_patterns(text: str) -> List[str]:
-    """Detect interesting patterns in text"""
+    Counts matches via finditer instead of len(findall) so no throwaway
+    list of substrings is built; the scan itself stays in C.
+    """
+    return sum(1 for _ in _CAPS_RE.finditer(text))
+
+
+def analyze_text_patterns(text: str, text_lower: str, codepoints: np.ndarray,
+                          char_counts: Dict[str, int]) -> List[str]:
+    """Detect interesting patterns in text.
+
+    Takes the lowercased text, the codepoint array and the punctuation
+    counts alongside the original so callers can share one .lower(), one
+    encode and one counting pass across all the helpers that need them.
+    """
     insights = []
-    
+
     # Exclamation marks (high energy)
-    exclamations = text.count('!')
+    exclamations = char_counts['!']
     if exclamations >= 3:
         insights.append(f"⚡ High energy detected ({exclamations} exclamation marks)")
-    
+
     # Question marks (curiosity/uncertainty)
-    questions = text.count('?')
+    questions = char_counts['?']
     if questions >= 3:
         insights.append(f"🤔 Question-heavy text ({questions} questions)")
     
     # ALL CAPS (intensity/shouting)
-    caps_words = re.findall(r'\b[A-Z]{2,}\b', text)
-    if len(caps_words) >= 2:
-        insights.append(f"📢 Intense language ({len(caps_words)} words in CAPS)")
-    
+    caps_words = _count_caps_words(text)
+    if caps_words >= 2:
+        insights.append(f"📢 Intense language ({caps_words} words in CAPS)")
+
     # Emojis
-    emoji_pattern = re.compile("["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport
-        "]+", flags=re.UNICODE)
-    emojis = emoji_pattern.findall(text)
-    if len(emojis) >= 3:
-        insights.append(f"😀 Emoji-rich text ({len(emojis)} emojis)")
+    emoji_count = _count_emojis(codepoints)
+    if emoji_count >= 3:
+        insights.append(f"😀 Emoji-rich text ({emoji_count} emojis)")
     
     # Ellipsis (trailing thought)
     if '...' in text or '…' in text:
         insights.append("💭 Contains ellipsis - thoughtful or uncertain")
     
+    keyword_hits = _keyword_counts(text_lower)
+
     # Sarcasm indicators
-    sarcasm_markers = ['yeah right', 'sure', 'totally', 'obviously', 'of course']
-    if any(marker in text.lower() for marker in sarcasm_markers):
+    if keyword_hits["sarcasm"]:
         insights.append("🎭 Possible sarcasm detected")
-    
+
     # Negations (sentiment flippers)
-    negations = len(re.findall(r'\b(not|no|never|none|nobody|nothing|neither|nowhere|hardly|scarcely|barely)\b', text.lower()))
+    negations = len(_NEGATION_RE.findall(text_lower))
     if negations >= 2:
         insights.append(f"🔄 Multiple negations ({negations}) - complex sentiment")
-    
+
     # Profanity/strong language (simplified check)
-    strong_words = ['hate', 'love', 'amazing', 'terrible', 'awful', 'worst', 'best']
-    strong_count = sum(1 for word in strong_words if word in text.lower())
-    if strong_count >= 2:
+    if keyword_hits["strong"] >= 2:
         insights.append("💥 Strong emotional language")
     
     return insights if insights else ["📝 Clean, straightforward text"]
 
-def get_text_stats(text: str) -> Dict:
+def get_text_stats(text: str, codepoints: np.ndarray, char_counts: Dict[str, int]) -> Dict:
     """Calculate text statistics"""
-    words = text.split()
-    sentences = text.count('.') + text.count('!') + text.count('?')
+    sentences = char_counts['.'] + char_counts['!'] + char_counts['?']
     sentences = max(sentences, 1)  # Avoid division by zero
-    
-    # Average word length
-    avg_word_length = sum(len(word) for word in words) / max(len(words), 1)
-    
+
+    # Word count and average length straight off the codepoint mask —
+    # preprocessing collapsed all whitespace to single spaces, so word
+    # boundaries are space->non-space transitions and no word list is built
+    non_space = codepoints != 0x20
+    word_chars = int(non_space.sum())
+    if word_chars:
+        word_count = int(non_space[0]) + int((non_space[1:] & ~non_space[:-1]).sum())
+    else:
+        word_count = 0
+    avg_word_length = word_chars / max(word_count, 1)
+
     # Formality (longer words = more formal)
     formality_score = min(avg_word_length / 7.0, 1.0)  # Normalize to 0-1
-    
+
     return {
-        "word_count": len(words),
+        "word_count": word_count,
         "character_count": len(text),
         "sentence_count": sentences,
         "avg_word_length": round(avg_word_length, 1),
         "formality": round(formality_score, 2)
     }
 
+def _polarity_label(polarity: float) -> str:
+    """Map a -1..1 polarity to a positive/neutral/negative vote."""
+    return "positive" if polarity > 0.1 else "negative" if polarity < -0.1 else "neutral"
+
+
+def _score_ensemble(vader_p: float, tb_p: float, hf_p: Optional[float]) -> tuple[float, float, float]:
+    """Combine per-model polarities into (avg_compound, confidence, agreement).
+
+    Weighted combination: vader (0.3), textblob (0.3), hf (0.4 if present);
+    without HF the two local models split the weight evenly. Confidence
+    blends signal strength with cross-model agreement.
+    """
+    if hf_p is not None:
+        avg_compound = vader_p * 0.3 + tb_p * 0.3 + hf_p * 0.4
+    else:
+        avg_compound = (vader_p + tb_p) * 0.5
+
+    votes = [_polarity_label(vader_p), _polarity_label(tb_p)]
+    if hf_p is not None:
+        votes.append(_polarity_label(hf_p))
+    # agreement score: fraction of models that agree on majority
+    majority = max(set(votes), key=votes.count)
+    agreement = votes.count(majority) / len(votes)
+
+    confidence = min(1.0, abs(avg_compound) * (0.6 + 0.4 * agreement))
+    return avg_compound, confidence, agreement
+
+
 def get_emotion_emoji(emotion: str) -> str:
     """Map emotion to emoji"""
     emotion_map = {
@@ -171,39 +462,18 @@ def get_emotion_emoji(emotion: str) -> str:
     return emotion_map.get(emotion, "😐")
 
 
-def detect_emotions_robust(text: str) -> tuple[Dict[str, float], str]:
+def detect_emotions_robust(text_lower: str) -> tuple[Dict[str, float], str]:
     """
     Rule-based emotion detection without external dependencies.
-    Returns (emotions_dict, dominant_emotion)
+    Expects already-lowercased text; returns (emotions_dict, dominant_emotion)
     """
-    text_lower = text.lower()
-    
-    # Happy indicators
-    happy_words = ['happy', 'joy', 'great', 'excellent', 'wonderful', 'amazing', 
-                   'love', 'good', 'best', 'awesome', 'fantastic', 'thrilled', 'excited',
-                   'delighted', 'pleased', 'glad', 'perfect', 'brilliant', '😊', '😀', '🎉', '❤️']
-    happy_score = sum(1 for word in happy_words if word in text_lower)
-    
-    # Angry indicators
-    angry_words = ['angry', 'hate', 'terrible', 'awful', 'worst', 'disgusting',
-                   'furious', 'mad', 'rage', 'annoyed', 'frustrated', 'irritated', '😠', '😡', '🤬']
-    angry_score = sum(1 for word in angry_words if word in text_lower)
-    
-    # Sad indicators
-    sad_words = ['sad', 'depressed', 'unhappy', 'miserable', 'disappointed',
-                 'sorry', 'unfortunate', 'bad', 'upset', 'down', 'heartbroken', '😢', '😭', '💔']
-    sad_score = sum(1 for word in sad_words if word in text_lower)
-    
-    # Fear indicators
-    fear_words = ['fear', 'scared', 'afraid', 'worried', 'anxious', 'nervous',
-                  'terrified', 'panic', 'concern', 'frightened', '😨', '😰']
-    fear_score = sum(1 for word in fear_words if word in text_lower)
-    
-    # Surprise indicators
-    surprise_words = ['surprise', 'shocked', 'amazed', 'unexpected', 'wow',
-                      'omg', 'unbelievable', 'incredible', 'astonishing', '😮', '😲']
-    surprise_score = sum(1 for word in surprise_words if word in text_lower)
-    
+    counts = _keyword_counts(text_lower)
+    happy_score = counts["happy"]
+    angry_score = counts["angry"]
+    sad_score = counts["sad"]
+    fear_score = counts["fear"]
+    surprise_score = counts["surprise"]
+
     # Normalize scores
     total_score = max(happy_score + angry_score + sad_score + fear_score + surprise_score, 1)
     
@@ -224,6 +494,42 @@ def detect_emotions_robust(text: str) -> tuple[Dict[str, float], str]:
     
     return emotions_dict, dominant_emotion
 
+
+# Cached analyzer wrappers: identical inputs (UI retries, double-submits,
+# demo texts) skip the analysis entirely and return in one dict lookup.
+
+@lru_cache(maxsize=2048)
+def _vader_scores(text: str) -> tuple[float, float, float, float]:
+    """Return (compound, pos, neu, neg) VADER scores for text."""
+    scores = _get_vader().polarity_scores(text)
+    return (scores['compound'], scores['pos'], scores['neu'], scores['neg'])
+
+
+@lru_cache(maxsize=2048)
+def _textblob_polsub(text: str) -> tuple[float, float]:
+    """Return (polarity, subjectivity) from TextBlob's pattern analyzer."""
+    sentiment = _get_pattern_analyzer().analyze(text)
+    return (sentiment.polarity, sentiment.subjectivity)
+
+
+@lru_cache(maxsize=2048)
+def _emotions(text_lower: str) -> tuple[Dict[str, float], str]:
+    """Cached wrapper around detect_emotions_robust (keyed on lowercased text)."""
+    return detect_emotions_robust(text_lower)
+
+
+@app.post("/cache/clear")
+def clear_caches():
+    """Debug endpoint: drop all cached analyzer results."""
+    _vader_scores.cache_clear()
+    _textblob_polsub.cache_clear()
+    _emotions.cache_clear()
+    _keyword_counts.cache_clear()
+    GEM_CACHE.clear()
+    HF_CACHE.clear()
+    return {"status": "cleared"}
+
+
 @app.get("/")
 def root():
     return {
@@ -236,74 +542,162 @@ def root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy", "service": "vibe-check-api"}
+    return {
+        "status": "healthy",
+        "service": "vibe-check-api",
+        "caches": {
+            "vader": _vader_scores.cache_info()._asdict(),
+            "textblob": _textblob_polsub.cache_info()._asdict(),
+            "emotions": _emotions.cache_info()._asdict(),
+            "keywords": _keyword_counts.cache_info()._asdict(),
+            "gemini": {"size": len(GEM_CACHE), "maxsize": GEM_CACHE.maxsize},
+            "hf": {"size": len(HF_CACHE), "maxsize": HF_CACHE.maxsize},
+        },
+    }
 
 
 def expand_contractions(text: str) -> str:
     """A small contraction expansion to help basic preprocessing without extra deps."""
-    contractions = {
-        "can't": "cannot",
-        "won't": "will not",
-        "n't": " not",
-        "'re": " are",
-        "'s": " is",
-        "'d": " would",
-        "'ll": " will",
-        "'ve": " have",
-        "'m": " am",
-    }
-    s = text
-    for k, v in contractions.items():
-        s = re.sub(k, v, s, flags=re.IGNORECASE)
-    return s
+    return _CONTRACTION_RE.sub(lambda m: CONTRACTIONS[m.group(0).lower()], text)
 
 
 def preprocess_text(text: str) -> str:
     """Run lightweight preprocessing steps to normalize text before analysis."""
     t = text.strip()
     # Normalize whitespace
-    t = re.sub(r"\s+", " ", t)
+    t = _WS_RE.sub(" ", t)
     # Expand simple contractions
     t = expand_contractions(t)
     return t
 
 
-def call_hf_sentiment(text: str) -> Optional[Dict[str, float]]:
-    """Call Hugging Face Inference API if HF_API_TOKEN is provided.
-    Returns a dict with keys "compound" or label scores depending on model output.
-    """
-    hf_token = os.environ.get("HF_API_TOKEN")
-    hf_model = os.environ.get("HF_MODEL", "distilbert-base-uncased-finetuned-sst-2-english")
-    if not hf_token:
+def _hf_polarity(items: Any) -> Optional[Dict[str, float]]:
+    """Convert one HF label/score list into a simple polarity -1..1 dict."""
+    # Typical output per text: [{"label":"POSITIVE","score":0.99}, ...]
+    if not isinstance(items, list):
         return None
+    score_map = {"POSITIVE": 1.0, "NEGATIVE": -1.0, "NEUTRAL": 0.0}
+    # Weighted average by score
+    total = 0.0
+    weight = 0.0
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        label = item.get("label", "")
+        s = float(item.get("score", 0.0))
+        total += score_map.get(label.upper(), 0.0) * s
+        weight += s
+    polarity = (total / weight) if weight else 0.0
+    return {"polarity": round(polarity, 3)}
+
 
-    url = f"https://api-inference.huggingface.co/models/{hf_model}"
-    headers = {"Authorization": f"Bearer {hf_token}"}
-    payload = {"inputs": text}
+async def _hf_sentiment_batch(texts: List[str]) -> List[Optional[Dict[str, float]]]:
+    """Score a batch of texts with one HF Inference API request."""
+    payload = {"inputs": texts}
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=10)
+        resp = await _HTTP.post(HF_URL, headers=HF_HEADERS, json=payload, timeout=10)
         if resp.status_code != 200:
-            return None
+            return [None] * len(texts)
         data = resp.json()
-        # Typical output: [{"label":"POSITIVE","score":0.99}, ...]
         if isinstance(data, dict) and data.get("error"):
-            return None
-        if isinstance(data, list):
-            # Convert to a simple polarity -1..1 using label mapping
-            score_map = {"POSITIVE": 1.0, "NEGATIVE": -1.0, "NEUTRAL": 0.0}
-            # Weighted average by score
-            total = 0.0
-            weight = 0.0
-            for item in data:
-                label = item.get("label", "")
-                s = float(item.get("score", 0.0))
-                total += score_map.get(label.upper(), 0.0) * s
-                weight += s
-            polarity = (total / weight) if weight else 0.0
-            return {"polarity": round(polarity, 3)}
+            return [None] * len(texts)
+        if not isinstance(data, list):
+            return [None] * len(texts)
+        # A single-text request may come back un-nested
+        if data and isinstance(data[0], dict):
+            data = [data]
+        return [
+            _hf_polarity(data[i]) if i < len(data) else None
+            for i in range(len(texts))
+        ]
     except Exception:
+        return [None] * len(texts)
+
+
+class _HFBatcher:
+    """Coalesce concurrent HF calls into one batched inference request.
+
+    Calls arriving within a small window are drained from a queue and sent
+    as a single {"inputs": [...]} payload; each caller awaits a future
+    resolved when the batch response lands. Amortizes the HF round-trip
+    across up to max_batch concurrent /analyze requests.
+    """
+
+    def __init__(self, max_batch: int = 16, window: float = 0.02):
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def score(self, text: str) -> Optional[Dict[str, float]]:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            results = await _hf_sentiment_batch([text for text, _ in batch])
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+_HF_BATCHER = _HFBatcher()
+
+
+async def call_hf_sentiment(text: str) -> Optional[Dict[str, float]]:
+    """Call Hugging Face Inference API if HF_API_TOKEN is provided.
+    Returns a dict with a "polarity" key, or None if unavailable.
+    """
+    if not HF_TOKEN:
         return None
-    return None
+
+    key = _text_key(text)
+    # single .get() rather than contains-then-index: an entry can expire
+    # between the two calls on a TTLCache
+    cached = HF_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    result = await _HF_BATCHER.score(text)
+    if result is not None:
+        HF_CACHE[key] = result
+    return result
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text after sentence-ending punctuation followed by whitespace.
+
+    Equivalent to re.split(r'(?<=[.!?])\\s+', text), but the lookbehind
+    forces the regex engine off its fast literal paths; scanning for the
+    punctuation runs and slicing manually avoids that.
+    """
+    sentences = []
+    start = 0
+    length = len(text)
+    for match in _SENT_END_RE.finditer(text):
+        end = match.end()
+        if end < length and text[end].isspace():
+            sentences.append(text[start:end])
+            start = end + 1
+            while start < length and text[start].isspace():
+                start += 1
+    if start < length:
+        sentences.append(text[start:])
+    return sentences
 
 
 def generate_rewrites(text: str) -> Dict[str, str]:
@@ -311,19 +705,19 @@ def generate_rewrites(text: str) -> Dict[str, str]:
     s = text.strip()
 
     # Softer: reduce exclamations, soften strong words
-    softer = re.sub(r"!+", "!", s)
-    softer = re.sub(r"\b(hate|terrible|awful|worst)\b", lambda m: {
+    softer = _EXCLAIM_RE.sub("!", s)
+    softer = _SOFTEN_RE.sub(lambda m: {
         'hate':'dislike', 'terrible':'unpleasant', 'awful':'unfortunate', 'worst':'not great'
-    }[m.group(0).lower()], softer, flags=re.IGNORECASE)
+    }[m.group(0).lower()], softer)
 
     # Professional: expand contractions, remove slang, avoid emojis/punct-heavy endings
     prof = expand_contractions(s)
-    prof = re.sub(r"\b(imo|idk|u)\b", lambda m: {'imo':'in my opinion','idk':'I do not know','u':'you'}[m.group(0).lower()], prof, flags=re.IGNORECASE)
+    prof = _SLANG_RE.sub(lambda m: {'imo':'in my opinion','idk':'I do not know','u':'you'}[m.group(0).lower()], prof)
     # remove unusual punctuation but keep common separators and quotes
-    prof = re.sub(r"[^\w\s\.-,\'\"]+", '', prof)
+    prof = _PUNCT_CLEAN_RE.sub('', prof)
 
     # Concise: keep first 2 sentences, remove fluff
-    sentences = re.split(r'(?<=[.!?])\s+', s)
+    sentences = _split_sentences(s)
     concise = ' '.join(sentences[:2]) if sentences else s
     if len(concise) > 200:
         concise = concise[:197].rsplit(' ', 1)[0] + '...'
@@ -365,19 +759,23 @@ class EnhanceResponse(BaseModel):
     key_takeaway: str
 
 
-def call_gemini_api(prompt: str) -> Optional[str]:
+def _strip_code_fence(response: str) -> str:
+    """Strip a surrounding markdown ``` fence in one regex match.
+
+    Replaces the old startswith/split/slice/join dance, which allocated
+    several intermediate lists per response.
+    """
+    cleaned = response.strip()
+    match = _FENCE_RE.match(cleaned)
+    return match.group(1) if match else cleaned
+
+
+async def call_gemini_api(prompt: str) -> Optional[str]:
     """Call Google Gemini API using GEMINI_API_KEY env var."""
-    api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("geminiapi")
-    if not api_key:
-        print("No Gemini API key found")
+    if not GEMINI_KEY:
+        logger.debug("No Gemini API key found")
         return None
-    
-    # Use v1beta API with gemini-2.0-flash model
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
-    headers = {
-        "Content-Type": "application/json",
-        "X-goog-api-key": api_key
-    }
+
     body = {
         "contents": [{
             "parts": [{"text": prompt}]
@@ -389,9 +787,9 @@ def call_gemini_api(prompt: str) -> Optional[str]:
     }
     
     try:
-        resp = requests.post(url, headers=headers, json=body, timeout=30)
+        resp = await _HTTP.post(GEMINI_URL, headers=GEMINI_HEADERS, content=orjson.dumps(body), timeout=30)
         if resp.status_code != 200:
-            print(f"Gemini API error: {resp.status_code} - {resp.text[:200]}")
+            logger.warning("Gemini API error: %s - %s", resp.status_code, resp.text[:200])
             return None
         data = resp.json()
         candidates = data.get("candidates", [])
@@ -402,20 +800,24 @@ def call_gemini_api(prompt: str) -> Optional[str]:
                 return parts[0].get("text", "")
         return None
     except Exception as e:
-        print(f"Gemini API exception: {str(e)}")
+        logger.warning("Gemini API exception: %s", e)
         return None
 
 
-def get_gemini_vibe_check(text: str) -> Optional[Dict[str, Any]]:
+async def get_gemini_vibe_check(text: str) -> Optional[Dict[str, Any]]:
     """
     Get AI-powered vibe check from Gemini.
     Returns sentiment analysis with reasoning and creative insights.
     """
-    api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("geminiapi")
-    if not api_key:
-        print("No Gemini API key configured")
+    if not GEMINI_KEY:
+        logger.debug("No Gemini API key configured")
         return None
-    
+
+    key = _text_key(text)
+    cached = GEM_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     prompt = f"""Analyze the sentiment and vibe of this text. Return ONLY valid JSON with this exact structure:
 
 {{
@@ -435,55 +837,46 @@ Text to analyze:
 
 Return only the JSON object, no markdown formatting or additional text."""
 
-    response = call_gemini_api(prompt)
+    response = await call_gemini_api(prompt)
     if not response:
-        print("No response from Gemini API")
+        logger.debug("No response from Gemini API")
         return None
     
     try:
-        # Clean up response
-        cleaned = response.strip()
-        
-        # Remove markdown code blocks if present
-        if cleaned.startswith('```'):
-            lines = cleaned.split('\n')
-            if lines[0].startswith('```'):
-                lines = lines[1:]
-            if lines and lines[-1].startswith('```'):
-                lines = lines[:-1]
-            cleaned = '\n'.join(lines)
-        
+        # Clean up response: strip any surrounding markdown fence
+        cleaned = _strip_code_fence(response)
+
         # Extract JSON
         jstart = cleaned.find('{')
         jend = cleaned.rfind('}') + 1
         if jstart >= 0 and jend > jstart:
             json_str = cleaned[jstart:jend]
-            parsed = json.loads(json_str)
-            print(f"Gemini analysis successful: {parsed.get('sentiment', 'unknown')}")
+            parsed = orjson.loads(json_str)
+            logger.debug("Gemini analysis successful: %s", parsed.get('sentiment', 'unknown'))
+            GEM_CACHE[key] = parsed
             return parsed
         else:
-            print(f"No JSON found in Gemini response: {cleaned[:200]}")
+            logger.debug("No JSON found in Gemini response: %s", cleaned[:200])
         return None
-    except json.JSONDecodeError as e:
-        print(f"Gemini JSON parsing error: {str(e)}")
-        print(f"Response was: {response[:300]}")
+    except orjson.JSONDecodeError as e:
+        logger.warning("Gemini JSON parsing error: %s", e)
+        logger.debug("Response was: %s", response[:300])
         return None
     except Exception as e:
-        print(f"Gemini unexpected error: {str(e)}")
+        logger.warning("Gemini unexpected error: %s", e)
         return None
 
 
 @app.post('/enhance', response_model=EnhanceResponse)
-def enhance_with_ai(payload: EnhanceInput):
+async def enhance_with_ai(payload: EnhanceInput):
     """Optional AI enhancement using Gemini for writing tips and improvements."""
     text = payload.text.strip()
     if not text:
         raise HTTPException(status_code=400, detail='Text cannot be empty')
 
     # If no Gemini API key, provide rule-based suggestions
-    if not os.environ.get("GEMINI_API_KEY"):
-        vader_scores = vader.polarity_scores(text)
-        compound = vader_scores['compound']
+    if not GEMINI_KEY:
+        compound = _vader_scores(text)[0]
         
         tips = []
         if compound < -0.2:
@@ -495,7 +888,7 @@ def enhance_with_ai(payload: EnhanceInput):
             tips.append("Consider adding more emotional language")
         
         improved = generate_rewrites(text).get('professional', text)
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _split_sentences(text)
         social = ' '.join(sentences[:2])[:240] if sentences else text[:240]
         
         return EnhanceResponse(
@@ -529,20 +922,17 @@ Text:{sentiment_info}
 
 Return only the JSON, no markdown formatting."""
 
-    response = call_gemini_api(prompt)
+    response = await call_gemini_api(prompt)
     if not response:
         raise HTTPException(status_code=502, detail="Gemini API request failed")
 
     try:
-        cleaned = response.strip()
-        if cleaned.startswith('```'):
-            lines = cleaned.split('\n')
-            cleaned = '\n'.join(lines[1:-1])
-        
+        cleaned = _strip_code_fence(response)
+
         jstart = cleaned.find('{')
         jend = cleaned.rfind('}') + 1
         if jstart >= 0 and jend > jstart:
-            parsed = json.loads(cleaned[jstart:jend])
+            parsed = orjson.loads(cleaned[jstart:jend])
             return EnhanceResponse(
                 writing_tips=parsed.get('writing_tips', []),
                 tone_suggestions=parsed.get('tone_suggestions', []),
@@ -556,106 +946,86 @@ Return only the JSON, no markdown formatting."""
         raise HTTPException(status_code=502, detail=f'Failed to parse Gemini response: {str(e)}')
 
 
-@app.post("/analyze", response_model=VibeResponse)
-def analyze_vibe(input_data: TextInput):
-    """
-    Enhanced sentiment analysis with multi-model approach and text insights
+def _patterns_and_stats(text: str, text_lower: str) -> tuple[List[str], Dict]:
+    """Pattern insights and text statistics off one shared codepoint buffer."""
+    codepoints = _codepoints(text)  # one encode shared by every vectorized scan
+    char_counts = _punct_counts(codepoints)
+    insights = analyze_text_patterns(text, text_lower, codepoints, char_counts)
+    text_stats = get_text_stats(text, codepoints, char_counts)
+    return insights, text_stats
+
+
+async def _local_scores(text: str) -> Dict[str, Any]:
+    """Run every local (lexicon-based) analyzer once and collect the results.
+
+    The four sub-analyses are independent, so they run concurrently on the
+    shared thread pool rather than back to back.
     """
-    text = preprocess_text(input_data.text)
-    
-    if not text:
-        raise HTTPException(status_code=400, detail="Text cannot be empty")
-    
-    if len(text) > 5000:
-        raise HTTPException(status_code=400, detail="Text is too long (max 5000 characters)")
-    
-    # === 1. VADER Analysis ===
-    vader_scores = vader.polarity_scores(text)
-    vader_compound = vader_scores['compound']
-    
-    # === 2. TextBlob Analysis ===
-    blob = TextBlob(text)
-    textblob_polarity = blob.sentiment.polarity  # -1 to 1
-    textblob_subjectivity = blob.sentiment.subjectivity  # 0 to 1
-    
+    # Lowercase once; every keyword/negation scan shares this copy
+    text_lower = text.lower()
+
+    loop = asyncio.get_running_loop()
+    (vader_compound, vader_pos, vader_neu, vader_neg), \
+        (textblob_polarity, textblob_subjectivity), \
+        (emotions_dict, dominant_emotion), \
+        (insights, text_stats) = await asyncio.gather(
+            loop.run_in_executor(_POOL, _vader_scores, text),
+            loop.run_in_executor(_POOL, _textblob_polsub, text),
+            loop.run_in_executor(_POOL, _emotions, text_lower),
+            loop.run_in_executor(_POOL, _patterns_and_stats, text, text_lower),
+        )
+
+    # Add subjectivity insight
+    if textblob_subjectivity > 0.7:
+        insights.append("💬 Highly subjective/personal opinion")
+    elif textblob_subjectivity < 0.3:
+        insights.append("📊 Objective and factual tone")
+
+    # Add formality insight
+    if text_stats["formality"] > 0.7:
+        insights.append("👔 Formal/professional language")
+    elif text_stats["formality"] < 0.4:
+        insights.append("😎 Casual/informal tone")
+
+    return {
+        "vader": (vader_compound, vader_pos, vader_neu, vader_neg),
+        "textblob": (textblob_polarity, textblob_subjectivity),
+        "emotions": (emotions_dict, dominant_emotion),
+        "insights": insights,
+        "text_stats": text_stats,
+    }
+
+
+def _assemble_vibe(local: Dict[str, Any],
+                   hf_result: Optional[Dict[str, float]],
+                   gemini_analysis: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine local analyzer output and AI results into VibeResponse fields."""
+    vader_compound, vader_pos, vader_neu, vader_neg = local["vader"]
+    textblob_polarity, textblob_subjectivity = local["textblob"]
+    emotions_dict, dominant_emotion = local["emotions"]
+    text_stats = local["text_stats"]
+    insights = list(local["insights"])  # copy: local may be assembled twice
+
     # Convert TextBlob polarity to pos/neu/neg format
     if textblob_polarity > 0.1:
-        tb_sentiment = "positive"
         tb_pos = abs(textblob_polarity)
         tb_neg = 0.0
         tb_neu = 1 - tb_pos
     elif textblob_polarity < -0.1:
-        tb_sentiment = "negative"
         tb_neg = abs(textblob_polarity)
         tb_pos = 0.0
         tb_neu = 1 - tb_neg
     else:
-        tb_sentiment = "neutral"
         tb_neu = 1.0
         tb_pos = 0.0
         tb_neg = 0.0
-    
-    # === 3. Emotion Detection (Improved) ===
-    emotions_dict, dominant_emotion = detect_emotions_robust(text)
-    
-    # === 4. Optional Hugging Face Analysis (if configured) ===
-    hf_result = call_hf_sentiment(text)
-    
-    # === 5. Gemini AI Vibe Check (if configured) ===
-    gemini_analysis = get_gemini_vibe_check(text)
-
-    # === 6. Consensus / Ensemble Analysis ===
-    # Weighted combination: vader (0.3), textblob (0.3), hf (0.4 if present)
-    weights = {"vader": 0.3, "textblob": 0.3}
-    if hf_result:
-        weights["hf"] = 0.4
-    else:
-        # normalize to sum to 1
-        weights["vader"] = 0.5
-        weights["textblob"] = 0.5
 
-    # map each model to a polarity in -1..1
-    vader_p = vader_compound
-    tb_p = textblob_polarity
+    # Consensus / ensemble analysis
     hf_p = hf_result.get("polarity") if hf_result else None
-
-    total = vader_p * weights.get("vader", 0) + tb_p * weights.get("textblob", 0)
-    if hf_p is not None:
-        total += hf_p * weights.get("hf", 0)
-    avg_compound = total
+    avg_compound, confidence, agreement = _score_ensemble(
+        vader_compound, textblob_polarity, hf_p)
     sentiment_data = get_sentiment_data(avg_compound)
-    
-    # Calculate confidence: combination of absolute polarity and agreement
-    vader_sent = "positive" if vader_compound > 0.1 else "negative" if vader_compound < -0.1 else "neutral"
-    tb_sent = tb_sentiment
-    models_votes = [vader_sent, tb_sent]
-    if hf_p is not None:
-        hf_sent = "positive" if hf_p > 0.1 else "negative" if hf_p < -0.1 else "neutral"
-        models_votes.append(hf_sent)
-    # agreement score: fraction of models that agree on majority
-    majority = max(set(models_votes), key=models_votes.count)
-    agree_count = models_votes.count(majority)
-    agreement = agree_count / len(models_votes)
 
-    # confidence combines agreement and signal strength
-    confidence = min(1.0, abs(avg_compound) * (0.6 + 0.4 * agreement))
-    
-    # === 6. Text Insights ===
-    insights = analyze_text_patterns(text)
-    text_stats = get_text_stats(text)
-    
-    # Add subjectivity insight
-    if textblob_subjectivity > 0.7:
-        insights.append("💬 Highly subjective/personal opinion")
-    elif textblob_subjectivity < 0.3:
-        insights.append("📊 Objective and factual tone")
-    
-    # Add formality insight
-    if text_stats["formality"] > 0.7:
-        insights.append("👔 Formal/professional language")
-    elif text_stats["formality"] < 0.4:
-        insights.append("😎 Casual/informal tone")
-    
     # Model agreement insight
     if agreement == 1.0:
         insights.append("✅ All models agree - high confidence!")
@@ -663,29 +1033,29 @@ def analyze_vibe(input_data: TextInput):
         insights.append("👍 Most models agree")
     else:
         insights.append("⚠️ Models disagree - nuanced sentiment")
-    
+
     # Add Gemini insight if available
     if gemini_analysis:
         insights.append(f"🤖 AI detected {gemini_analysis.get('energy_level', 'medium')} energy level")
-    
-    return VibeResponse(
-        sentiment=sentiment_data["sentiment"],
-        confidence=round(confidence, 3),
-        scores={
-            "positive": round(vader_scores['pos'], 3),
-            "neutral": round(vader_scores['neu'], 3),
-            "negative": round(vader_scores['neg'], 3),
-        },
-        vibe=sentiment_data["vibe"],
-        emoji=sentiment_data["emoji"],
-        color=sentiment_data["color"],
-        # NEW fields
-        models={
+
+    # Round the VADER breakdown once; both "scores" and models.vader use it
+    vader_scores = {
+        "positive": round(vader_pos, 3),
+        "neutral": round(vader_neu, 3),
+        "negative": round(vader_neg, 3),
+    }
+
+    return {
+        "sentiment": sentiment_data["sentiment"],
+        "confidence": round(confidence, 3),
+        "scores": vader_scores,
+        "vibe": sentiment_data["vibe"],
+        "emoji": sentiment_data["emoji"],
+        "color": sentiment_data["color"],
+        "models": {
             "vader": {
                 "compound": round(vader_compound, 3),
-                "positive": round(vader_scores['pos'], 3),
-                "neutral": round(vader_scores['neu'], 3),
-                "negative": round(vader_scores['neg'], 3)
+                **vader_scores,
             },
             "textblob": {
                 "polarity": round(textblob_polarity, 3),
@@ -693,22 +1063,113 @@ def analyze_vibe(input_data: TextInput):
                 "positive": round(tb_pos, 3),
                 "neutral": round(tb_neu, 3),
                 "negative": round(tb_neg, 3)
-            }
-                ,
-                **({"hf": {"polarity": round(hf_p, 3)}} if hf_p is not None else {})
+            },
+            **({"hf": {"polarity": round(hf_p, 3)}} if hf_p is not None else {})
         },
-        emotions={
+        "emotions": {
             "joy": round(emotions_dict.get("Happy", 0), 3),
             "anger": round(emotions_dict.get("Angry", 0), 3),
             "sadness": round(emotions_dict.get("Sad", 0), 3),
             "fear": round(emotions_dict.get("Fear", 0), 3),
             "surprise": round(emotions_dict.get("Surprise", 0), 3)
         },
-        dominant_emotion=dominant_emotion,
-        insights=insights,
-        text_stats=text_stats,
-        gemini_analysis=gemini_analysis
-    )
+        "dominant_emotion": dominant_emotion,
+        "insights": insights,
+        "text_stats": text_stats,
+        "gemini_analysis": gemini_analysis,
+    }
+
+
+def _validate_analyze_text(raw: str) -> str:
+    """Shared /analyze input validation; returns the preprocessed text."""
+    # Validate on the raw payload before any regex work: an oversized
+    # request must not get a preprocessing pass before being rejected
+    if not raw or not raw.strip():
+        raise HTTPException(status_code=400, detail="Text cannot be empty")
+
+    if len(raw) > 5000:
+        raise HTTPException(status_code=400, detail="Text is too long (max 5000 characters)")
+
+    return preprocess_text(raw)
+
+
+async def _analyze_text(text: str) -> Dict[str, Any]:
+    """Full analysis pipeline for one preprocessed text.
+
+    Kicks off the two network calls first so they overlap with the local
+    analysis (and with each other): wall-clock becomes
+    max(gemini, hf, local) instead of their sum.
+    """
+    hf_task = asyncio.create_task(call_hf_sentiment(text))
+    gemini_task = asyncio.create_task(get_gemini_vibe_check(text))
+
+    local = await _local_scores(text)
+
+    hf_result, gemini_analysis = await asyncio.gather(hf_task, gemini_task)
+    return _assemble_vibe(local, hf_result, gemini_analysis)
+
+
+@app.post("/analyze")
+async def analyze_vibe(input_data: TextInput):
+    """
+    Enhanced sentiment analysis with multi-model approach and text insights
+
+    Returns the payload as a plain dict (shape documented by VibeResponse):
+    with no response_model, FastAPI hands it straight to orjson instead of
+    validating and re-serializing an object we just built ourselves.
+    """
+    text = _validate_analyze_text(input_data.text)
+    payload = await _analyze_text(text)
+    if payload["gemini_analysis"] is None:
+        # match the old response_model_exclude_none contract
+        del payload["gemini_analysis"]
+    return payload
+
+
+class BatchInput(BaseModel):
+    texts: List[str]
+
+
+@app.post("/analyze_batch", response_model=List[VibeResponse], response_model_exclude_none=True)
+async def analyze_batch(payload: BatchInput):
+    """Score many texts in one request.
+
+    Amortizes per-request overhead (validation, connection handling) and
+    lets the HF micro-batcher coalesce the whole batch into a single
+    inference call; the per-text pipelines run concurrently.
+    """
+    if not payload.texts:
+        raise HTTPException(status_code=400, detail="texts cannot be empty")
+    if len(payload.texts) > 64:
+        raise HTTPException(status_code=400, detail="Batch is too large (max 64 texts)")
+
+    texts = [_validate_analyze_text(t) for t in payload.texts]
+    payloads = await asyncio.gather(*(_analyze_text(t) for t in texts))
+    # model_construct: the payloads are built internally, skip re-validation
+    return [VibeResponse.model_construct(**p) for p in payloads]
+
+
+@app.post("/analyze/stream")
+async def analyze_vibe_stream(input_data: TextInput):
+    """Stream the vibe check as server-sent events.
+
+    Emits a 'local' event with the lexicon-based analysis as soon as it is
+    ready (milliseconds), then a 'final' event with the HF/Gemini-enriched
+    result once the slow AI calls land. /analyze keeps its single-JSON
+    contract; this endpoint is for clients that want something on screen
+    while Gemini is thinking.
+    """
+    text = _validate_analyze_text(input_data.text)
+
+    async def event_stream():
+        hf_task = asyncio.create_task(call_hf_sentiment(text))
+        gemini_task = asyncio.create_task(get_gemini_vibe_check(text))
+        local = await _local_scores(text)
+        yield b"event: local\ndata: " + orjson.dumps(_assemble_vibe(local, None, None)) + b"\n\n"
+        hf_result, gemini_analysis = await asyncio.gather(hf_task, gemini_task)
+        yield b"event: final\ndata: " + orjson.dumps(_assemble_vibe(local, hf_result, gemini_analysis)) + b"\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 if __name__ == "__main__":
     